@@ -10,19 +10,32 @@ Creates a professional CCPM schedule visualization with:
 
 from typing import Tuple, List
 from collections import namedtuple
+from functools import lru_cache
+import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Rectangle, Polygon, FancyArrowPatch
+from matplotlib.collections import LineCollection, PathCollection, PolyCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.font_manager import FontProperties
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D, Bbox
 from matplotlib import rcParams
 
 # ---------- Type Definitions ----------
 Point = Tuple[float, float]
 Box = Tuple[float, float, float, float]  # (x, y, width, height)
-ShapeData = namedtuple("ShapeData", ["points", "box"])
+Segment = Tuple[Point, Point]            # (start, end)
+ShapeData = namedtuple("ShapeData", ["points", "box", "color", "label"])
+LabelData = namedtuple("LabelData", ["path", "xy", "color"])
 
 # ---------- Theme & Colors ----------
-rcParams["pdf.fonttype"] = 42
-rcParams["ps.fonttype"]  = 42
+rcParams["pdf.fonttype"] = 3   # Type 3 glyphs: ASCII-only labels, skips TTF subsetting
+rcParams["ps.fonttype"]  = 3
+rcParams["svg.fonttype"] = "none"  # reference system fonts instead of embedding paths
 rcParams["font.size"]    = 10
+rcParams["svg.hashsalt"] = ""  # deterministic ids, shorter diffs between exports
+rcParams["figure.autolayout"] = False  # margins are set explicitly; no layout solver
 
 EDGE       = "#222222"
 TASK_COLOR = "#E8E8E8"   # tasks
@@ -37,89 +50,268 @@ BUFFER_WIDTH = 1.6
 BUFFER_HEIGHT = 0.8
 TRAP_INDENT = 0.4  # trapezoid left indent factor
 FLAG_SIZE = 0.5
+FLAG_HEIGHT_FACTOR = 0.58  # flag height relative to its base width
 TEXT_SIZE = 11
 FLAG_TEXT_SIZE = 10
 FONT_WEIGHT = "bold"
 TEXT_COLOR = "#1a1a1a"
+ARROW_HEAD_LEN = 0.14        # arrow head length (data units)
+ARROW_HEAD_HALF_WIDTH = 0.07 # arrow head half-width (data units)
+SNAP_GRID = 1e-3             # coordinate grid for short decimals in vector output
+
+# Shared FontProperties so every label reuses one resolved font instead of
+# re-resolving rcParams in each Text constructor.
+_BOLD_11 = FontProperties(weight=FONT_WEIGHT, size=TEXT_SIZE)
+_BOLD_10 = FontProperties(weight=FONT_WEIGHT, size=FLAG_TEXT_SIZE)
+
+# Canonical unit shapes; each task/buffer/flag instance is an affine copy
+# (scale + translate) of one of these shared vertex arrays, so no per-call
+# Python vertex list is built or validated.
+_RECT_PATH = Path.unit_rectangle()
+_TRAP_PATH = Path([(0, 0), (1, 0), (1, 1), (TRAP_INDENT, 1), (0, 0)],
+                  [Path.MOVETO] + [Path.LINETO]*3 + [Path.CLOSEPOLY], readonly=True)
+_FLAG_PATH = Path([(0, 0), (1, 0), (0.5, FLAG_HEIGHT_FACTOR), (0, 0)],
+                  [Path.MOVETO] + [Path.LINETO]*2 + [Path.CLOSEPOLY], readonly=True)
+
+# Labels come from a small fixed alphabet, so their vector outlines are
+# built once and reused; this also keeps text out of the PDF font subsetter.
+_GLYPH_CACHE: dict = {}
+
+
+def _snap(v: float, grid: float = SNAP_GRID) -> float:
+    """Snap a coordinate to the export grid so it serializes as a short decimal."""
+    return round(v / grid) * grid
+
+
+def _glyph(txt: str, prop: FontProperties) -> Path:
+    """Return the cached vector outline of txt for the given font."""
+    key = (txt, prop.get_size(), prop.get_weight())
+    path = _GLYPH_CACHE.get(key)
+    if path is None:
+        path = _GLYPH_CACHE[key] = TextPath((0, 0), txt, size=prop.get_size(), prop=prop)
+    return path
+
+
+def _label_data(x: float, y: float, txt: str, prop: FontProperties,
+                va: str = "center", color: str = "black") -> LabelData:
+    """Build a glyph-path label anchored at the data point (x, y).
+
+    The cached glyph path is recentred and scaled from points to inches
+    here; render_labels later draws every label in one PathCollection.
+    """
+    glyph = _glyph(txt, prop)
+    bb = glyph.get_extents()
+    ox = -(bb.x0 + bb.x1) / 2
+    oy = -(bb.y0 + bb.y1) / 2 if va == "center" else 0.0
+    path = glyph.transformed(Affine2D().translate(ox, oy).scale(1.0 / 72.0))
+    return LabelData(path=path, xy=(x, y), color=color)
 
 # ---------- Shape Helpers ----------
 def task(ax: plt.Axes, x: float, y: float, w: float = TASK_WIDTH,
-         h: float = TASK_HEIGHT, txt: str = "") -> Box:
-    """Create a rectangular task box on the diagram."""
-    rect = Rectangle((x, y), w, h, facecolor=TASK_COLOR, edgecolor=EDGE, linewidth=1.4)
-    ax.add_patch(rect)
-    ax.text(x + w/2, y + h/2, txt, ha="center", va="center",
-            fontsize=TEXT_SIZE, fontweight=FONT_WEIGHT, color=TEXT_COLOR)
-    return (x, y, w, h)
+         h: float = TASK_HEIGHT, txt: str = "") -> ShapeData:
+    """Lay out a rectangular task box; vertices are rendered later in one batch."""
+    pts = np.round(_RECT_PATH.vertices[:-1] * (w, h) + (x, y), 3)
+    label = _label_data(x + w/2, y + h/2, txt, _BOLD_11, color=TEXT_COLOR) if txt else None
+    return ShapeData(points=pts, box=(x, y, w, h), color=TASK_COLOR, label=label)
 
 
 def trap_left(ax: plt.Axes, x: float, y: float, w: float = BUFFER_WIDTH,
               h: float = BUFFER_HEIGHT, txt: str = "FB", color: str = FB_COLOR) -> ShapeData:
-    """Create a left-facing trapezoid (buffer) on the diagram.
-    
+    """Lay out a left-facing trapezoid (buffer); rendered later in one batch.
+
     Returns:
-        ShapeData with polygon points and bounding box.
+        ShapeData with polygon points, bounding box and face color.
     """
-    indent = TRAP_INDENT * w
-    pts = [(x, y), (x + w, y), (x + w, y + h), (x + indent, y + h)]
-    poly = Polygon(pts, closed=True, facecolor=color, edgecolor=EDGE, linewidth=1.4)
-    ax.add_patch(poly)
-    ax.text(x + 0.70*w, y + h/2, txt, ha="center", va="center",
-            fontsize=TEXT_SIZE, fontweight=FONT_WEIGHT)
-    return ShapeData(points=pts, box=(x, y, w, h))
+    pts = np.round(_TRAP_PATH.vertices[:-1] * (w, h) + (x, y), 3)
+    label = _label_data(x + 0.70*w, y + h/2, txt, _BOLD_11) if txt else None
+    return ShapeData(points=pts, box=(x, y, w, h), color=color, label=label)
 
 
 def rb_flag(ax: plt.Axes, x: float, y: float, s: float = FLAG_SIZE,
-            label: str = "RB") -> Polygon:
-    """Create a triangle flag (resource buffer) on the diagram."""
-    tri = Polygon([(x, y), (x + s, y), (x + 0.5*s, y + 0.58*s)],
-                  closed=True, facecolor=RB_COLOR, edgecolor=EDGE, linewidth=1.4)
-    ax.add_patch(tri)
-    ax.text(x + 0.5*s, y + 0.8*s, label, ha="center", va="bottom",
-            fontsize=FLAG_TEXT_SIZE, fontweight=FONT_WEIGHT)
-    return tri
+            label: str = "RB") -> ShapeData:
+    """Lay out a triangle flag (resource buffer); rendered later in one batch."""
+    pts = np.round(_FLAG_PATH.vertices[:-1] * (s, s) + (x, y), 3)
+    label_data = _label_data(x + 0.5*s, y + 0.8*s, label, _BOLD_10, va="bottom") if label else None
+    return ShapeData(points=pts, box=(x, y, s, FLAG_HEIGHT_FACTOR*s), color=RB_COLOR,
+                     label=label_data)
 
 # ---------- Anchor Helpers ----------
 def left_mid(box: Box) -> Point:
     """Get the midpoint of the left edge of a box."""
     x, y, w, h = box
-    return (x, y + h/2)
+    return (_snap(x), _snap(y + h/2))
 
 
 def right_mid(box: Box) -> Point:
     """Get the midpoint of the right edge of a box."""
     x, y, w, h = box
-    return (x + w, y + h/2)
+    return (_snap(x + w), _snap(y + h/2))
 
 
 def top_mid(box: Box) -> Point:
     """Get the midpoint of the top edge of a box."""
     x, y, w, h = box
-    return (x + w/2, y + h)
+    return (_snap(x + w/2), _snap(y + h))
 
 
 def bottom_mid(box: Box) -> Point:
     """Get the midpoint of the bottom edge of a box."""
     x, y, w, h = box
-    return (x + w/2, y)
+    return (_snap(x + w/2), _snap(y))
 
 
 def center(box: Box) -> Point:
     """Get the center point of a box."""
     x, y, w, h = box
-    return (x + w/2, y + h/2)
+    return (_snap(x + w/2), _snap(y + h/2))
+
+# ---------- Vectorized Anchor Helpers ----------
+# Counterparts of the scalar helpers above for an (N, 4) array of boxes,
+# returning (N, 2) point arrays in a single NumPy operation.
+def left_mid_v(boxes: np.ndarray) -> np.ndarray:
+    """Left-edge midpoints of an array of boxes."""
+    return np.stack([boxes[:, 0], boxes[:, 1] + boxes[:, 3]/2], axis=1)
+
+
+def right_mid_v(boxes: np.ndarray) -> np.ndarray:
+    """Right-edge midpoints of an array of boxes."""
+    return np.stack([boxes[:, 0] + boxes[:, 2], boxes[:, 1] + boxes[:, 3]/2], axis=1)
+
+
+def top_mid_v(boxes: np.ndarray) -> np.ndarray:
+    """Top-edge midpoints of an array of boxes."""
+    return np.stack([boxes[:, 0] + boxes[:, 2]/2, boxes[:, 1] + boxes[:, 3]], axis=1)
+
+
+def bottom_mid_v(boxes: np.ndarray) -> np.ndarray:
+    """Bottom-edge midpoints of an array of boxes."""
+    return np.stack([boxes[:, 0] + boxes[:, 2]/2, boxes[:, 1]], axis=1)
+
+
+def center_v(boxes: np.ndarray) -> np.ndarray:
+    """Center points of an array of boxes."""
+    return boxes[:, :2] + boxes[:, 2:]/2
+
+@lru_cache(maxsize=2048)
+def _arrow_path(dx: float, dy: float) -> Path:
+    """Build the arrow Path for a displacement, anchored at the origin.
+
+    Memoized so arrows with the same displacement share one frozen Path;
+    callers should round (dx, dy) so nearly-equal arrows hit the cache.
+    """
+    length = (dx*dx + dy*dy) ** 0.5
+    ux, uy = dx / length, dy / length
+    nx, ny = -uy, ux
+    bx, by = dx - ARROW_HEAD_LEN*ux, dy - ARROW_HEAD_LEN*uy
+    verts = [(0, 0), (bx, by),
+             (dx, dy),
+             (bx + ARROW_HEAD_HALF_WIDTH*nx, by + ARROW_HEAD_HALF_WIDTH*ny),
+             (bx - ARROW_HEAD_HALF_WIDTH*nx, by - ARROW_HEAD_HALF_WIDTH*ny),
+             (dx, dy)]
+    codes = [Path.MOVETO, Path.LINETO,
+             Path.MOVETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY]
+    return Path(verts, codes, readonly=True)
 
 
 def arrow(ax: plt.Axes, p1: Point, p2: Point, width: float = 1.4) -> None:
-    """Draw an arrow between two points."""
-    ax.add_patch(FancyArrowPatch(p1, p2, arrowstyle="->", mutation_scale=12,
-                                 linewidth=width, color=EDGE))
+    """Draw a single arrow between two points.
+
+    One-off counterpart to render_arrows: the shaft/head geometry comes
+    from the _arrow_path cache, translated to the start point.
+    """
+    dx = round(p2[0] - p1[0], 4)
+    dy = round(p2[1] - p1[1], 4)
+    path = _arrow_path(dx, dy).transformed(Affine2D().translate(*p1))
+    ax.add_patch(PathPatch(path, facecolor=EDGE, edgecolor=EDGE, linewidth=width))
+
+# ---------- Batch Renderers ----------
+def render_shapes(ax: plt.Axes, shapes: List[ShapeData]) -> None:
+    """Render all accumulated shapes in a single PolyCollection."""
+    ax.add_collection(PolyCollection(
+        [s.points for s in shapes],
+        facecolors=to_rgba_array([s.color for s in shapes]),
+        edgecolors=EDGE, linewidths=1.4))
+
+
+def render_labels(ax: plt.Axes, shapes: List[ShapeData]) -> None:
+    """Render every shape label in a single PathCollection.
+
+    Label paths are in inches (recentred by _label_data); the collection
+    maps them to pixels through dpi_scale_trans while the anchor offsets
+    go through transData, so one artist draws all labels dpi-safely.
+    """
+    labels = [s.label for s in shapes if s.label is not None]
+    if not labels:
+        return
+    coll = PathCollection([l.path for l in labels],
+                          facecolors=[l.color for l in labels], edgecolors="none",
+                          offsets=[l.xy for l in labels],
+                          offset_transform=ax.transData, zorder=3)
+    coll.set_transform(ax.figure.dpi_scale_trans)
+    ax.add_collection(coll, autolim=False)
+
+
+def render_arrows(ax: plt.Axes, segments: List[Segment], width: float = 1.4) -> None:
+    """Render all accumulated arrows as one LineCollection plus one head batch."""
+    segs = np.round(np.asarray(segments, dtype=float), 3)  # (N, 2, 2), grid-snapped
+    tails, tips = segs[:, 0], segs[:, 1]
+    direction = tips - tails
+    length = np.hypot(direction[:, 0], direction[:, 1])[:, None]
+    unit = direction / length
+    normal = np.stack([-unit[:, 1], unit[:, 0]], axis=1)
+    base = np.round(tips - ARROW_HEAD_LEN * unit, 3)
+
+    ax.add_collection(LineCollection(np.stack([tails, base], axis=1),
+                                     colors=EDGE, linewidths=width))
+    heads = np.round(np.stack([tips,
+                               base + ARROW_HEAD_HALF_WIDTH * normal,
+                               base - ARROW_HEAD_HALF_WIDTH * normal], axis=1), 3)
+    ax.add_collection(PolyCollection(heads, facecolors=EDGE, edgecolors="none"))
+
+
+def figure_extent(fig: plt.Figure, ax: plt.Axes) -> Bbox:
+    """Compute the export bounding box analytically, in inches.
+
+    All geometry is known from the layout constants, so the box is the
+    union of the data extents with the band of figure-level text (subtitle
+    at the top, legend at the bottom) -- no per-artist bbox walk needed.
+    """
+    xmin, xmax = ax.get_xlim()
+    ymin, ymax = ax.get_ylim()
+    data_disp = ax.transData.transform_bbox(Bbox.from_extents(xmin, ymin, xmax, ymax))
+    text_disp = fig.transFigure.transform_bbox(Bbox.from_extents(0.03, 0.04, 0.97, 1.0))
+    return Bbox.union([data_disp, text_disp]).transformed(fig.dpi_scale_trans.inverted())
+
+
+def export_figure(fig: plt.Figure, ax: plt.Axes, output_base: str,
+                  formats: Tuple[str, ...] = ("png", "pdf", "svg")) -> List[str]:
+    """Export the figure to every requested format off a single warm draw.
+
+    Matplotlib cannot share one renderer across backends, so the practical
+    single-draw export is: rasterize once on the Agg canvas to populate the
+    text-layout, path-simplification and transform caches, then let each
+    per-format print hit those warm caches instead of redoing the shared
+    renderer-independent work.
+    """
+    fig.canvas.draw()
+    tight_bbox = figure_extent(fig, ax).padded(0.1)
+    written = []
+    with plt.rc_context({"path.simplify": True, "path.simplify_threshold": 1.0}):
+        for fmt in formats:
+            filename = f"{output_base}.{fmt}"
+            kwargs = {"bbox_inches": tight_bbox, "pad_inches": 0, "metadata": {}}
+            if fmt == "png":
+                kwargs["dpi"] = 300
+            fig.canvas.print_figure(filename, format=fmt, **kwargs)
+            written.append(filename)
+    return written
 
 # ---------- Diagram Generation ----------
-def create_ccpm_diagram() -> None:
-    """Generate and export the CCPM diagram."""
+@lru_cache(maxsize=None)
+def _build_figure() -> Tuple[plt.Figure, plt.Axes]:
+    """Build the CCPM figure once; repeat calls return the cached figure."""
     # Figure setup
-    fig, ax = plt.subplots(figsize=(12.6, 5.0))
+    fig, ax = plt.subplots(figsize=(12.6, 5.0), layout=None)
     fig.suptitle("Critical Chain Schedule with Buffers", fontsize=14, fontweight="bold", y=0.98)
     fig.text(0.5, 0.945, "(Online Examination System Upgrade)", ha="center", va="center", fontsize=11)
 
@@ -129,59 +321,75 @@ def create_ccpm_diagram() -> None:
     y_feed_1 = 2.10   # F feeder row
     y_feed_2 = 1.60   # G feeder row
     gap = 0.20        # visual air gap for feeder arrows
-    
+
+    # Geometry accumulators: shapes/arrows are drawn in one batch each below.
+    shapes: List[ShapeData] = []
+    arrows: List[Segment] = []
+
     # ---------- Critical Chain (Main Tasks) ----------
-    A = task(ax, x0 + 0*dx, y_main, txt="A")
-    B = task(ax, x0 + 1*dx, y_main, txt="B")
-    C = task(ax, x0 + 2*dx, y_main, txt="C")
-    D = task(ax, x0 + 3*dx, y_main, txt="D")
-    E = task(ax, x0 + 4*dx, y_main, txt="E")
-    H = task(ax, x0 + 5*dx, y_main, txt="H")
-    I = task(ax, x0 + 6*dx, y_main, txt="I")
-    PB_data = trap_left(ax, x0 + 7*dx, y_main, txt="PB", color=PB_COLOR)
-
-    # Chain arrows (sequential connections)
-    chain = [(A, B), (B, C), (C, D), (D, E), (E, H), (H, I)]
-    for from_task, to_task in chain:
-        arrow(ax, right_mid(from_task), left_mid(to_task))
+    main_xs = x0 + np.arange(8) * dx  # all main-row x positions in one shot
+    A = task(ax, main_xs[0], y_main, txt="A")
+    B = task(ax, main_xs[1], y_main, txt="B")
+    C = task(ax, main_xs[2], y_main, txt="C")
+    D = task(ax, main_xs[3], y_main, txt="D")
+    E = task(ax, main_xs[4], y_main, txt="E")
+    H = task(ax, main_xs[5], y_main, txt="H")
+    I = task(ax, main_xs[6], y_main, txt="I")
+    PB_data = trap_left(ax, main_xs[7], y_main, txt="PB", color=PB_COLOR)
+    shapes.extend([A, B, C, D, E, H, I, PB_data])
+
+    # Chain arrows (sequential connections): all endpoints in one NumPy pass
+    chain_boxes = np.array([s.box for s in (A, B, C, D, E, H, I)])
+    chain_segs = np.stack([right_mid_v(chain_boxes[:-1]),
+                           left_mid_v(chain_boxes[1:])], axis=1)
+    arrows.extend(chain_segs)
 
     # I -> PB: aim at the PB left-edge midpoint
     pb_left_mid = (PB_data.points[0][0], (PB_data.points[0][1] + PB_data.points[3][1]) / 2.0)
-    arrow(ax, right_mid(I), pb_left_mid)
+    arrows.append((right_mid(I.box), pb_left_mid))
 
     # ---------- Feeders (Parallel Tasks with Buffers) ----------
-    def create_feeder(feeder_task: Box, feeder_y: float, buffer_x: float,
-                      main_task: Box, buffer_label: str = "FB") -> None:
+    def create_feeder(feeder_task: ShapeData, feeder_y: float, buffer_x: float,
+                      main_task: ShapeData, buffer_label: str = "FB") -> None:
         """Create a feeder task -> buffer -> main task connection."""
         fb_data = trap_left(ax, buffer_x, feeder_y, txt=buffer_label, color=FB_COLOR)
-        arrow(ax, center(feeder_task), left_mid(fb_data.box))
-        
+        shapes.append(fb_data)
+        arrows.append((center(feeder_task.box), left_mid(fb_data.box)))
+
         bm_buffer = bottom_mid(fb_data.box)
-        tm_task = top_mid(main_task)
-        arrow(ax, (bm_buffer[0], bm_buffer[1] - gap), (tm_task[0], tm_task[1] + gap))
+        tm_task = top_mid(main_task.box)
+        arrows.append(((bm_buffer[0], bm_buffer[1] - gap), (tm_task[0], tm_task[1] + gap)))
 
     # F -> FB1 -> E
     F = task(ax, x0 + 2.6*dx, y_feed_1, txt="F")
+    shapes.append(F)
     create_feeder(F, y_feed_1, x0 + 4.15*dx, E)
 
     # G -> FB2 -> H
     G = task(ax, x0 + 3.45*dx, y_feed_2, txt="G")
+    shapes.append(G)
     create_feeder(G, y_feed_2, x0 + 5.00*dx, H)
 
     # ---------- Resource Buffers (Flags) ----------
-    def create_resource_flag(flag_x: float, flag_y: float, target_task: Box,
+    def create_resource_flag(flag_x: float, flag_y: float, target_task: ShapeData,
                              target_offset: float, label: str) -> None:
         """Create a resource buffer flag pointing to a task."""
-        rb_flag(ax, flag_x, flag_y, label=label)
+        shapes.append(rb_flag(ax, flag_x, flag_y, label=label))
         rb_pos = (flag_x + FLAG_SIZE/2, flag_y - 0.40)
-        target_point = (target_task[0] + target_task[2]*target_offset, target_task[1] + gap)
-        arrow(ax, rb_pos, target_point)
+        target_box = target_task.box
+        target_point = (target_box[0] + target_box[2]*target_offset, target_box[1] + gap)
+        arrows.append((rb_pos, target_point))
 
     # RB before C (DBA)
-    create_resource_flag(x0 + 2*dx - 1.0, y_main - 1.00, C, 0.78, "RB (DBA)")
+    create_resource_flag(main_xs[2] - 1.0, y_main - 1.00, C, 0.78, "RB (DBA)")
 
     # RB before H (QA)
-    create_resource_flag(x0 + 5*dx - 1.0, y_main - 1.00, H, 0.78, "RB (QA)")
+    create_resource_flag(main_xs[5] - 1.0, y_main - 1.00, H, 0.78, "RB (QA)")
+
+    # ---------- Batched Rendering ----------
+    render_shapes(ax, shapes)
+    render_labels(ax, shapes)
+    render_arrows(ax, arrows)
 
     # ---------- Legend & Formatting ----------
     legend_text = (
@@ -193,19 +401,18 @@ def create_ccpm_diagram() -> None:
     ax.set_xlim(0, x0 + 8.4*dx)
     ax.set_ylim(-0.9, 2.8)
     ax.axis("off")
-    plt.tight_layout(rect=[0.03, 0.10, 0.97, 0.90])
+    fig.subplots_adjust(left=0.03, right=0.97, bottom=0.10, top=0.90)
+    return fig, ax
+
+
+def create_ccpm_diagram() -> None:
+    """Generate and export the CCPM diagram."""
+    fig, ax = _build_figure()
 
     # Export
-    output_base = "ccpm_from_slides_clean"
-    formats = ["png", "pdf", "svg"]
-    for fmt in formats:
-        filename = f"{output_base}.{fmt}"
-        kwargs = {"bbox_inches": "tight"}
-        if fmt == "png":
-            kwargs["dpi"] = 300
-        plt.savefig(filename, **kwargs)
-    
-    print(f"✅ Exported: {', '.join(f'{output_base}.{fmt}' for fmt in formats)}")
+    written = export_figure(fig, ax, "ccpm_from_slides_clean")
+
+    print(f"✅ Exported: {', '.join(written)}")
     plt.show()
 
 